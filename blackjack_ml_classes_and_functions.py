@@ -1,5 +1,228 @@
 import random
-import pickle
+import sys
+import numpy as np
+import numba
+from numba import njit, prange
+
+_SUITS = ['\u2660', '\u2661', '\u2662', '\u2663']  # Spades, Hearts, Diamonds, Clubs
+_RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
+
+# Blackjack value of each rank in _RANKS. The compiled training loop draws
+# ranks uniformly from this array, treating the deck as infinite.
+_RANK_VALUES = np.array([2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 11], dtype=np.int8)
+_RANK_TO_VALUE = dict(zip(_RANKS, _RANK_VALUES.tolist()))
+
+@njit(cache=True)
+def _add_card(hand_sum, aces, value):
+    """
+    Adds a card value to a hand total, downgrading Aces from 11 to 1 as needed.
+
+    Returns:
+        tuple: The new (hand_sum, aces) where aces counts Aces still valued at 11.
+    """
+    hand_sum += value
+    if value == 11:
+        aces += 1
+
+    # Each downgraded Ace removes 10, so ceil(over / 10) of them are needed
+    over = hand_sum - 21
+    down = 0 if over <= 0 else min(aces, (over + 9) // 10)
+
+    return hand_sum - 10 * down, aces - down
+
+@njit(cache=True)
+def _draw_card():
+    """
+    Draws a card value from an infinite deck.
+    """
+    return _RANK_VALUES[np.random.randint(0, _RANK_VALUES.size)]
+
+@njit(cache=True)
+def _play_training_game(q_table, visits, trajectory, alpha, gamma, epsilon):
+    """
+    Plays one training game, updating q_table in place and counting each
+    update in visits. Cards are drawn from an infinite deck, since depleting
+    a real deck by the few cards of one game barely changes the odds.
+
+    If the player stands, the dealer draws as in play_game (Dealer.should_hit,
+    hitting on 17 or less). The (player_sum, action) pairs visited are
+    recorded in trajectory, and only the final reward is used: the pair t
+    steps before the end of the game is moved towards reward * gamma**t.
+    """
+    player_sum, player_aces = _add_card(0, 0, _draw_card())
+    player_sum, player_aces = _add_card(player_sum, player_aces, _draw_card())
+    dealer_card = _draw_card()
+    dealer_sum, dealer_aces = _add_card(0, 0, dealer_card)
+    dealer_sum, dealer_aces = _add_card(dealer_sum, dealer_aces, _draw_card())
+    steps = 0
+
+    while True:
+        u = np.random.random()
+        if u < epsilon:
+            # Random action (exploration); u is uniform on [0, epsilon) here
+            action = 0 if u < 0.5 * epsilon else 1
+        elif q_table[player_sum, dealer_card, 0] >= q_table[player_sum, dealer_card, 1]:
+            action = 0
+        else:
+            action = 1
+
+        trajectory[steps, 0] = player_sum
+        trajectory[steps, 1] = action
+        steps += 1
+
+        if action == 1:
+            break
+
+        player_sum, player_aces = _add_card(player_sum, player_aces, _draw_card())
+
+        if player_sum > 21:
+            break
+
+    if player_sum <= 21:
+        while dealer_sum <= 17:
+            dealer_sum, dealer_aces = _add_card(dealer_sum, dealer_aces, _draw_card())
+
+    if player_sum > 21:
+        reward = -1.0
+    elif dealer_sum > 21:
+        reward = 1.0
+    elif dealer_sum > player_sum:
+        reward = -0.5
+    elif dealer_sum == player_sum:
+        reward = 0.5
+    else:
+        reward = 1.0
+
+    discounted = reward
+    for t in range(steps - 1, -1, -1):
+        state_sum = trajectory[t, 0]
+        action = trajectory[t, 1]
+        q_table[state_sum, dealer_card, action] += alpha * (
+            discounted - q_table[state_sum, dealer_card, action]
+        )
+        visits[state_sum, dealer_card, action] += 1
+        discounted *= gamma
+
+@njit(cache=True, parallel=True)
+def _train_kernel(q_table, n_games, alpha, gamma, epsilon, decay_rate, n_threads):
+    """
+    Compiled Q-learning loop behind AI_Player.train_module.
+
+    The games are split into one chunk per thread (n_threads). Each chunk
+    trains its own copy of q_table, and the copies are merged back into
+    q_table as an average weighted by how often each state-action pair was
+    updated. Pairs that no chunk visited keep their previous value.
+
+    Returns:
+        float: The decayed exploration rate.
+    """
+    n_chunks = min(n_threads, max(n_games, 1))
+    q_local = np.empty((n_chunks,) + q_table.shape)
+    visits_local = np.zeros((n_chunks,) + q_table.shape)
+
+    for c in prange(n_chunks):
+        q_local[c] = q_table
+        # Each hit raises the hard total by at least 1, so a game has at most
+        # 20 hits before busting, plus a final stand
+        trajectory = np.empty((21, 2), dtype=np.int64)
+        first = c * n_games // n_chunks
+        last = (c + 1) * n_games // n_chunks
+        # Exploration rate this chunk would have reached when training sequentially
+        chunk_epsilon = max(0.1, epsilon * decay_rate ** first)
+
+        for _ in range(first, last):
+            _play_training_game(q_local[c], visits_local[c], trajectory, alpha, gamma,
+                                chunk_epsilon)
+            chunk_epsilon = max(0.1, chunk_epsilon * decay_rate)
+
+    visits = visits_local.sum(axis=0)
+    merged = (q_local * visits_local).sum(axis=0) / np.maximum(visits, 1.0)
+    q_table[:] = np.where(visits > 0, merged, q_table)
+
+    return max(0.1, epsilon * decay_rate ** n_games)
+
+# Distinct card values of an infinite deck and the probability of drawing each
+_CARD_VALUES, _CARD_COUNTS = np.unique(_RANK_VALUES.astype(np.int64), return_counts=True)
+_CARD_PROBS = _CARD_COUNTS / _RANK_VALUES.size
+
+def _dealer_outcomes():
+    """
+    Computes the distribution of the dealer's final hand for each visible card,
+    following Dealer.should_hit (hit on 17 or less) with an infinite deck.
+
+    Returns:
+        np.ndarray: Array of shape (12, 5) indexed by [dealer_card_value, outcome],
+            where outcomes 0-3 are final sums 18-21 and outcome 4 is a bust.
+    """
+    memo = {}
+
+    def outcomes(hand_sum, aces):
+        if hand_sum > 21:
+            return np.array([0.0, 0.0, 0.0, 0.0, 1.0])
+        if hand_sum >= 18:
+            dist = np.zeros(5)
+            dist[hand_sum - 18] = 1.0
+            return dist
+        if (hand_sum, aces) not in memo:
+            dist = np.zeros(5)
+            for value, prob in zip(_CARD_VALUES, _CARD_PROBS):
+                dist += prob * outcomes(*_add_card(hand_sum, aces, value))
+            memo[hand_sum, aces] = dist
+        return memo[hand_sum, aces]
+
+    table = np.zeros((12, 5))
+    for value in _CARD_VALUES:
+        table[value] = outcomes(*_add_card(0, 0, value))
+    return table
+
+def solve_q_table(gamma=0.95, tol=1e-9):
+    """
+    Computes the Q-table directly by value iteration instead of simulating games.
+
+    Cards are drawn from an infinite deck and the player's total is treated as a
+    hard total, since the (player_sum, dealer_card_value) state does not record
+    whether an Ace is still counted as 11. The dealer plays as in play_game and
+    the training games (Dealer.should_hit). Rewards are -1 for a bust, and
+    -0.5, 0.5 or 1 for losing, tying or winning after standing. Training deals
+    soft hands that this model treats as hard, so learned and solved tables can
+    differ where the two actions are close in value.
+
+    Args:
+        gamma (float): The discount factor.
+        tol (float): Stop once no Q-value changes by more than this amount.
+
+    Returns:
+        np.ndarray: A Q-table of the same shape as AI_Player.q_table.
+    """
+    sums = np.arange(22)
+    next_sums = np.array([[_add_card(s, 0, v)[0] for v in _CARD_VALUES] for s in sums])
+    hit_busts = next_sums > 21
+    next_sums = np.minimum(next_sums, 21)
+
+    # Standing never changes the state, so its value is fixed by the dealer's outcomes
+    dealer = _dealer_outcomes()
+    finals = np.arange(18, 22)
+    stand_rewards = np.zeros((22, 5))
+    stand_rewards[:, :4] = np.where(finals > sums[:, None], -0.5,
+                                    np.where(finals == sums[:, None], 0.5, 1.0))
+    stand_rewards[:, 4] = 1.0
+    stand = stand_rewards @ dealer.T
+
+    q_table = np.zeros((22, 12, 2))
+    q_table[:, :, 1] = stand
+    while True:
+        next_values = np.where(hit_busts[:, :, None], -1.0,
+                               gamma * q_table.max(axis=2)[next_sums])
+        hit = np.einsum('c,scd->sd', _CARD_PROBS, next_values)
+        delta = np.abs(hit - q_table[:, :, 0]).max()
+        q_table[:, :, 0] = hit
+        if delta < tol:
+            break
+
+    # Only player sums 4-21 against dealer cards 2-11 are reachable
+    q_table[:4] = 0.0
+    q_table[:, :2] = 0.0
+    return q_table
 
 class Player:
     """
@@ -10,55 +233,48 @@ class Player:
         """
         Initializes a player with an empty hand and a 'not busted' state.
         """
+        self.reset_hand()
+
+    def reset_hand(self):
+        """
+        Empties the player's hand and clears the 'busted' state for a new game.
+        """
         self.busted = False
         self.hand = []
+        self._sum = 0  # Running hand total, kept up to date by hit()
+        self._aces = 0  # Aces in the hand still counted as 11
 
     def hit(self, deck):
         """
-        Adds a card from the deck to the player's hand.
+        Adds a card from the deck to the player's hand and updates the hand total.
         Args:
             deck (Deck): The deck to deal a card from.
         """
-        self.hand.append(deck.deal_card())
+        card = deck.deal_card()
+        self.hand.append(card)
+        # Plain Python version of the compiled helper, avoiding Numba call overhead
+        self._sum, self._aces = _add_card.py_func(self._sum, self._aces, card.value)
 
     def show_hand(self):
         """
         Prints the player's hand in a readable format.
         """
-        for i in range(len(self.hand)):
-            print(self.hand[i], end=" ")
+        print(_format_hand(self.hand), end=" ")
 
     def get_hand_sum(self):
         """
-        Calculates the total value of the player's hand, accounting for Aces.
+        Returns the total value of the player's hand, accounting for Aces.
 
         Returns:
             int: The total value of the player's hand.
         """
-        hand_sum = 0
-        aces = 0
-        
-        for i in range(len(self.hand)):
-            if self.hand[i].rank.isalpha() and self.hand[i].rank != "A":
-                hand_sum += 10  # Face cards count as 10
-            elif self.hand[i].rank == "A":
-                hand_sum += 11  # Aces initially count as 11
-                aces += 1
-            else:
-                hand_sum += int(self.hand[i].rank)  # Number cards are added directly
-
-        # Adjust Aces if the total exceeds 21
-        while hand_sum > 21 and aces:
-            hand_sum -= 10
-            aces -= 1
-
-        return hand_sum
+        return self._sum
 
     def is_busted(self):
         """
         Updates the player's 'busted' status based on their hand value.
         """
-        if self.get_hand_sum() > 21:
+        if self._sum > 21:
             self.busted = True
 
 class AI_Player(Player):
@@ -69,9 +285,12 @@ class AI_Player(Player):
     def __init__(self, learning_rate=0.3, discount_factor=0.95, exploration_rate=1.0):
         """
         Initializes the AI player with Q-learning parameters and an empty Q-table.
+
+        The Q-table is a dense array indexed by [player_sum, dealer_card_value, action],
+        where action 0 is 'hit' and 1 is 'stand'.
         """
         super().__init__()
-        self.q_table = {}
+        self.q_table = np.zeros((22, 12, 2), dtype=np.float64)
         self.alpha = learning_rate
         self.gamma = discount_factor
         self.epsilon = exploration_rate
@@ -87,16 +306,7 @@ class AI_Player(Player):
         Returns:
             tuple: A state representation as (player_sum, rank_dealer_card).
         """
-        rank_dealer_card = None
-
-        if dealer_card.rank.isalpha() and dealer_card.rank != 'A':
-            rank_dealer_card = 10
-        elif dealer_card.rank == 'A':
-            rank_dealer_card = 11
-        else:
-            rank_dealer_card = int(dealer_card.rank)
-
-        return (player_sum, rank_dealer_card)
+        return (player_sum, dealer_card.value)
 
     def choose_action(self, state):
         """
@@ -108,10 +318,14 @@ class AI_Player(Player):
         Returns:
             str: 'hit' or 'stand'.
         """
-        if random.random() < self.epsilon:
-            return random.choice(['hit', 'stand'])  # Random action (exploration)
+        u = random.random()
+        if u < self.epsilon:
+            # Random action (exploration); u is uniform on [0, epsilon) here
+            return 'hit' if u < 0.5 * self.epsilon else 'stand'
+
+        row = self.q_table[state]  # View of the two action values
 
-        if self.q_table.get(state, [0, 0])[0] >= self.q_table.get(state, [0, 0])[1]:
+        if row[0] >= row[1]:
             return 'hit'
         else:
             return 'stand'
@@ -127,15 +341,15 @@ class AI_Player(Player):
             next_state (tuple or None): The next state.
         """
         action_index = 0 if action == 'hit' else 1
+        row = self.q_table[state]  # View, so updating it updates the Q-table
 
-        next_max = max(self.q_table.get(next_state, [0, 0])) if next_state else 0
-        old_q = self.q_table.get(state, [0, 0])[action_index]
-        new_value = old_q + self.alpha * (reward + self.gamma * next_max - old_q)
-
-        if state not in self.q_table:
-            self.q_table[state] = [0, 0]
+        if next_state:
+            next_row = self.q_table[next_state]
+            next_max = max(next_row[0], next_row[1])
+        else:
+            next_max = 0.0
 
-        self.q_table[state][action_index] = new_value
+        row[action_index] += self.alpha * (reward + self.gamma * next_max - row[action_index])
 
     def decay_exploration(self, decay_rate):
         """
@@ -153,55 +367,15 @@ class AI_Player(Player):
         Args:
             n_games (int): The number of training games.
         """
-        for _ in range(n_games):
-            self.hand = []
-            self.busted = False
-            deck = Deck()
-            dealer = Dealer()
-            deck.shuffle_deck()
-            self.hit(deck)
-            self.hit(deck)
-            dealer.hit(deck)
-            dealer.hit(deck)
-
-            state = self.get_state(self.get_hand_sum(), dealer.hand[0])
-
-            while not self.busted:
-                choice = self.choose_action(state)
-
-                if choice == 'stand':
-                    break
-
-                self.hit(deck)
-                self.is_busted()
-                reward = None
-
-                if self.busted:
-                    reward = -1
-                    next_state = None
-                else:
-                    reward = 1
-                    next_state = self.get_state(self.get_hand_sum(), dealer.hand[0])
-
-                self.update_q_value(state, choice, reward, next_state)
-                state = next_state
-
-            if self.busted:
-                pass
-
-            elif dealer.get_hand_sum() > self.get_hand_sum():
-                reward = -0.5
-                self.update_q_value(state, choice, reward, None)
+        self.epsilon = _train_kernel(self.q_table, n_games, self.alpha, self.gamma,
+                                     self.epsilon, 0.9999, numba.get_num_threads())
 
-            elif dealer.get_hand_sum() == self.get_hand_sum():
-                reward = 0.5
-                self.update_q_value(state, choice, reward, None)
-
-            else:
-                reward = 1
-                self.update_q_value(state, choice, reward, None)
-
-            self.decay_exploration(0.9999)
+    def solve_module(self):
+        """
+        Fills the Q-table with exact action values computed by solve_q_table,
+        as a fast alternative to train_module.
+        """
+        self.q_table = solve_q_table(self.gamma)
 
 class Dealer(Player):
     """
@@ -231,9 +405,13 @@ class Card:
     def __init__(self, rank, suit):
         self.rank = rank
         self.suit = suit
+        # Face cards count as 10, Aces initially as 11, number cards at face value
+        self.value = _RANK_TO_VALUE[rank]
+        self.is_ace = rank == 'A'
+        self._str = rank + suit  # Rank and suit never change, so build the label once
 
     def __str__(self):
-        return self.rank + self.suit
+        return self._str
 
 class Deck:
     """
@@ -241,15 +419,15 @@ class Deck:
     """
 
     def __init__(self):
-        suits = ['\u2660', '\u2661', '\u2662', '\u2663']  # Spades, Hearts, Diamonds, Clubs
-        ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
-        self.cards = [Card(rank, suit) for suit in suits for rank in ranks]
+        self.cards = [Card(rank, suit) for suit in _SUITS for rank in _RANKS]
+        self._i = 0  # Index of the next card to deal
 
     def shuffle_deck(self):
         """
         Shuffles the deck randomly.
         """
         random.shuffle(self.cards)
+        self._i = 0
 
     def deal_card(self):
         """
@@ -258,10 +436,21 @@ class Deck:
         Returns:
             Card: The top card from the deck.
         """
-        return self.cards.pop(0)
+        card = self.cards[self._i]
+        self._i += 1
+        return card
 
     def __str__(self):
-        return ' '.join(str(card) for card in self.cards)
+        return ' '.join(card._str for card in self.cards[self._i:])
+
+def _format_hand(hand):
+    """
+    Formats a hand as space-separated cards.
+
+    Returns:
+        str: The cards of the hand.
+    """
+    return ' '.join(card._str for card in hand)
 
 def get_user_input():
     """
@@ -275,43 +464,57 @@ def get_user_input():
         query = input("Invalid input. Please enter 'yes' or 'no': ").strip().lower()
     return query
 
-def play_game():
+def play_game(verbose=True, n_games=None):
     """
-    Simulates a game between the AI player and the dealer.
+    Simulates games between the AI player and the dealer.
+
+    By default games are played one at a time, asking after each whether to
+    watch another. When n_games is given, that many games are played without
+    prompting, so that with verbose=False nothing is read or written.
+
+    Args:
+        verbose (bool): Whether to print each game. The output of a game is
+            collected and written in one call once the game is over.
+        n_games (int or None): The number of games to play without prompting.
+
+    Returns:
+        dict: The number of games the bot won, lost and tied, keyed by
+            'win', 'loss' and 'tie'.
     """
-    query = 'yes'
+    tally = {'win': 0, 'loss': 0, 'tie': 0}
+    query = 'no' if n_games is not None and n_games <= 0 else 'yes'
 
-    with open("training_bot.pkl", "rb") as bot_file:
-        p1 = pickle.load(bot_file)
+    p1 = AI_Player()
+    p1.q_table = np.load("training_bot.npy")
 
     while query == 'yes':
         deck = Deck()
         dealer = Dealer()
         deck.shuffle_deck()
-        p1.hand = []
-        p1.busted = False
+        p1.reset_hand()
         p1.epsilon = 0
         p1.hit(deck)
         p1.hit(deck)
         dealer.hit(deck)
         dealer.hit(deck)
+        parts = []
 
-        print("AI player's cards are: ", end=" ")
-        p1.show_hand()
-        print()
-        print("The dealer's first card is: ", end=" ")
-        dealer.show_first_card()
+        if verbose:
+            parts.append(f"AI player's cards are: {_format_hand(p1.hand)}")
+            parts.append(f"The dealer's first card is: {dealer.hand[0]}")
 
         state = p1.get_state(p1.get_hand_sum(), dealer.hand[0])
 
-        while not p1.busted and p1.choose_action(state) == 'hit':
+        while p1.choose_action(state) == 'hit':
             p1.hit(deck)
             p1.is_busted()
-            print("AI player's cards are now: ", end=" ")
-            p1.show_hand()
-            print()
+            if verbose:
+                parts.append(f"AI player's cards are now: {_format_hand(p1.hand)}")
             if p1.busted:
-                print("Bot busted out.")
+                if verbose:
+                    parts.append("Bot busted out.")
+                tally['loss'] += 1
+                break
             state = p1.get_state(p1.get_hand_sum(), dealer.hand[0])
 
         if not p1.busted:
@@ -320,20 +523,25 @@ def play_game():
                 dealer.is_busted()
 
             if dealer.busted:
-                print("Dealer's hand: ", end="")
-                dealer.show_hand()
-                print("\nDealer busted out. Bot wins!")
+                outcome, result = 'win', "Dealer busted out. Bot wins!"
             elif dealer.get_hand_sum() > p1.get_hand_sum():
-                print("Dealer's hand: ", end="")
-                dealer.show_hand()
-                print("\nDealer wins!")
+                outcome, result = 'loss', "Dealer wins!"
             elif dealer.get_hand_sum() == p1.get_hand_sum():
-                print("Dealer's hand: ", end="")
-                dealer.show_hand()
-                print("\nTie!")
+                outcome, result = 'tie', "Tie!"
             else:
-                print("Dealer's hand: ", end="")
-                dealer.show_hand()
-                print("\nBot wins!")
+                outcome, result = 'win', "Bot wins!"
+            tally[outcome] += 1
+
+            if verbose:
+                parts.append(f"Dealer's hand: {_format_hand(dealer.hand)}")
+                parts.append(result)
+
+        if verbose:
+            sys.stdout.write('\n'.join(parts) + '\n')
+
+        if n_games is None:
+            query = get_user_input()
+        elif sum(tally.values()) >= n_games:
+            query = 'no'
 
-        query = get_user_input()
+    return tally
@@ -1,4 +1,4 @@
-import blackjack_ml_classes_and_functions
+from blackjack_ml_classes_and_functions import play_game
 
 
 #Run game
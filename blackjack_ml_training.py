@@ -1,6 +1,5 @@
-import pickle
-import random
-import blackjack_ml_classes_and_functions
+import numpy as np
+from blackjack_ml_classes_and_functions import AI_Player
 
 training_bot = AI_Player()
 
@@ -9,8 +8,6 @@ for i in range(50000):
     
     training_bot.train_module()
 
-with open("training_bot.pkl", "wb") as bot_file:
-
-    pickle.dump(training_bot, bot_file)
-    print("file check")
+np.save("training_bot.npy", training_bot.q_table)
+print("file check")
 